@@ -0,0 +1,41 @@
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True, fastmath=True)
+def sample_circular(a_km, inc_rad, raan_rad, argp_rad, n):
+    """Sample n ECI positions (km) along a circular orbit as (x, y, z) arrays.
+
+    Applies the classical 3-1-3 rotation (raan, inc, argp) to points on a
+    circle of radius a_km, with the scalar products written out so Numba
+    emits a single tight loop with no temporaries. Returns three contiguous
+    1-D float64 arrays (structure-of-arrays), ready to hand to a plotting
+    trace without column slicing.
+    """
+    cO, sO = np.cos(raan_rad), np.sin(raan_rad)
+    ci, si = np.cos(inc_rad), np.sin(inc_rad)
+    cw, sw = np.cos(argp_rad), np.sin(argp_rad)
+
+    # Perifocal -> ECI rotation matrix entries
+    r11 = cO * cw - sO * sw * ci
+    r12 = -cO * sw - sO * cw * ci
+    r21 = sO * cw + cO * sw * ci
+    r22 = -sO * sw + cO * cw * ci
+    r31 = sw * si
+    r32 = cw * si
+
+    x = np.empty(n)
+    y = np.empty(n)
+    z = np.empty(n)
+    for k in range(n):
+        theta = 2.0 * np.pi * k / (n - 1)
+        px = a_km * np.cos(theta)
+        py = a_km * np.sin(theta)
+        x[k] = r11 * px + r12 * py
+        y[k] = r21 * px + r22 * py
+        z[k] = r31 * px + r32 * py
+    return x, y, z
+
+
+# Warm the JIT cache at import so the first callback doesn't pay compile cost
+sample_circular(6878.0, 0.9, 0.0, 0.0, 2)
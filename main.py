@@ -1,11 +1,9 @@
+from functools import lru_cache
+
 import numpy as np
 import dash
 from dash import dcc, html, Input, Output, State
-from poliastro.bodies import Earth
-from poliastro.twobody import Orbit
-from astropy import units as u
-from poliastro.plotting.static import StaticOrbitPlotter
-from astropy.time import Time
+from core_orbit import sample_circular
 import plotly.graph_objs as go
 
 
@@ -15,6 +13,31 @@ import plotly.graph_objs as go
 app = dash.Dash(__name__)
 app.title = "SmallSat Mission Planner"
 
+# WGS84 equatorial radius; the callback works in plain km/radians
+R_EARTH_KM = 6378.137
+
+# Preset orbits as (altitude km, inclination deg); CUSTOM falls through
+# to the user-entered values
+_PRESETS = {
+    'LEO': (500.0, 51.6),
+    'SSO': (600.0, 97.5),
+    'POLAR': (700.0, 90.0),
+}
+
+# Figure layout is identical every callback — validate it once at import
+_ORBIT_LAYOUT = go.Layout(
+    scene=dict(
+        xaxis_title='X (km)',
+        yaxis_title='Y (km)',
+        zaxis_title='Z (km)',
+        aspectmode="cube"
+    ),
+    margin=dict(l=0, r=0, b=0, t=0),
+    showlegend=True,
+    height=600,
+    title="Orbit Visualization"
+)
+
 # Layout
 app.layout = html.Div([
     html.Div([
@@ -33,10 +56,10 @@ app.layout = html.Div([
         ),
 
         html.Label("Altitude (km)"),
-        dcc.Input(id='altitude', type='number', value=500),
+        dcc.Input(id='altitude', type='number', value=500, debounce=True),
 
         html.Label("Inclination (deg)"),
-        dcc.Input(id='inclination', type='number', value=97.5),
+        dcc.Input(id='inclination', type='number', value=97.5, debounce=True),
 
         html.Hr(),
 
@@ -53,19 +76,19 @@ app.layout = html.Div([
         ),
 
         html.Label("Resolution (m)"),
-        dcc.Input(id='sensor-resolution', type='number', value=10),
+        dcc.Input(id='sensor-resolution', type='number', value=10, debounce=True),
 
         html.Hr(),
 
         html.H4("Power Budget"),
         html.Label("Solar Panel Area (m²)"),
-        dcc.Input(id='solar-area', type='number', value=1.5),
+        dcc.Input(id='solar-area', type='number', value=1.5, debounce=True),
 
         html.Label("Solar Cell Efficiency (%)"),
-        dcc.Input(id='solar-eff', type='number', value=28),
+        dcc.Input(id='solar-eff', type='number', value=28, debounce=True),
 
         html.Label("Average Power Consumption (W)"),
-        dcc.Input(id='power-consumption', type='number', value=50),
+        dcc.Input(id='power-consumption', type='number', value=50, debounce=True),
 
         html.Button("Update Orbit", id='update-btn')
     ], style={'display': 'inline', 'width': '50%', 'float': 'left', 'padding': '20px'}),
@@ -85,89 +108,45 @@ app.layout = html.Div([
         html.Div(id='power-budget-output', style={'fontSize': '18px'}),
 
         html.H2("Data Budget Analysis"),
-        html.Div(id='data-budget-output', style={'fontSize': '18px'})
+        html.Div(id='data-budget-output', style={'fontSize': '18px'}),
+
+        # Small server-computed numbers land here; clientside callbacks
+        # render the text divs from it without extra server outputs
+        dcc.Store(id='mission-outputs')
     ], style={'width': '70%', 'float': 'right', 'padding': '5px'})
 
 ])
 
-# Data Budget
-def estimate_data_rate(sensor_type, resolution):
-    # Sample data generation rates for different sensors
-    if sensor_type == "MSI":
-        return resolution * 0.1  # MB per orbit ( example )
-    elif sensor_type == "HSI":
-        return resolution * 0.5  # MB per orbit
-    elif sensor_type == "SAR":
-        return resolution * 1.0  # MB per orbit
-    return 0
-
-
-def calculate_onboard_storage(data_rate, downlink_time, mission_duration):
-    data_per_day = data_rate * downlink_time
-    return data_per_day * mission_duration  # MB
-
-
-# Callbacks
-@app.callback(
-    [Output('orbit-plot', 'figure'),
-     Output('revisit-time-output', 'children'),
-     Output('power-budget-output', 'children'),
-     Output('data-budget-output', 'children')],
-    Input('update-btn', 'n_clicks'),
-    State('orbit-type', 'value'),
-    State('altitude', 'value'),
-    State('inclination', 'value'),
-    State('sensor-type', 'value'),
-    State('sensor-resolution', 'value'),
-    State('solar-area', 'value'),
-    State('solar-eff', 'value'),
-    State('power-consumption', 'value')
-)
-
-
-
-def update_orbit(n_clicks, orbit_type, altitude, inclination, sensor_type, sensor_resolution, solar_area, solar_eff, power_consumption):
-    if orbit_type == 'LEO':
-        alt = 500 * u.km
-        inc = 51.6 * u.deg
-    elif orbit_type == 'SSO':
-        alt = 600 * u.km
-        inc = 97.5 * u.deg
-    elif orbit_type == 'POLAR':
-        alt = 700 * u.km
-        inc = 90.0 * u.deg
-    else:  # CUSTOM
-        alt = (altitude or 500) * u.km
-        inc = (inclination or 90) * u.deg
+@lru_cache(maxsize=64)
+def _build_orbit_fig_dict(alt_km, inc_deg):
+    """Build the orbit figure for the given geometry, cached as a plain dict.
 
-    # Orbit calculation
-    a = Earth.R + alt
-    ecc = 0 * u.one
-    raan = 0 * u.deg
-    argp = 0 * u.deg
-    nu = 0 * u.deg
+    Plotly figures are mutable, so the cache stores fig.to_dict(); callers
+    wrap it in a fresh go.Figure. Repeat clicks with the same orbit (e.g.
+    only the power inputs changed) skip the sampling and figure build.
+    """
+    a_km = R_EARTH_KM + alt_km
+    inc_rad = np.deg2rad(inc_deg)
 
-    orbit = Orbit.from_classical(Earth, a, ecc, inc, raan, argp, nu, epoch=Time.now())
+    # Plot the orbit using Plotly, starting from the prebuilt layout
+    fig = go.Figure(layout=_ORBIT_LAYOUT)
 
-    # Plot the orbit using Plotly
-    fig = go.Figure()
-
-    # Generate points for the orbit path (in 3D)
+    # Sample the full orbit path with the compiled circular-orbit kernel
+    # (every selectable orbit has ecc=0, so the general propagator is overkill)
     num_points = 500
-    times = np.linspace(0, 2 * np.pi, num_points)
-    x_vals, y_vals, z_vals = [], [], []
+    x, y, z = sample_circular(a_km, inc_rad, 0.0, 0.0, num_points)
 
-    for t in times:
-        pos = orbit.propagate(t)  # Propagate the orbit
-        x_vals.append(pos.r[0].value)
-        y_vals.append(pos.r[1].value)
-        z_vals.append(pos.r[2].value)
+    # Rendering only needs ~6 significant figures, so ship float32 rounded
+    # to 0.1 km — roughly halves the JSON payload the browser has to parse
+    x = np.round(x, 1).astype(np.float32)
+    y = np.round(y, 1).astype(np.float32)
+    z = np.round(z, 1).astype(np.float32)
 
     # Add orbit path to the plot
     fig.add_trace(go.Scatter3d(
-        x=x_vals,
-        y=y_vals,
-        z=z_vals,
+        x=x,
+        y=y,
+        z=z,
         mode='lines',
         line=dict(color='blue', width=4),
         name="Orbit Path"
@@ -183,47 +162,107 @@ def update_orbit(n_clicks, orbit_type, altitude, inclination, sensor_type, senso
         name="Earth"
     ))
 
-    # Update layout
-    fig.update_layout(
-        scene=dict(
-            xaxis_title='X (km)',
-            yaxis_title='Y (km)',
-            zaxis_title='Z (km)',
-            aspectmode="cube"
-        ),
-        margin=dict(l=0, r=0, b=0, t=0),
-        showlegend=True,
-        height=600,
-        title="Orbit Visualization"
+    return fig.to_dict()
+
+
+# Data Budget
+
+# Sample data generation rates per sensor, MB per orbit ( example );
+# mirrored by the clientside data-budget callback below
+_RATES = {"MSI": 0.1, "HSI": 0.5, "SAR": 1.0}
+
+
+def estimate_data_rate(sensor_type, resolution):
+    return resolution * _RATES.get(sensor_type, 0.0)
+
+
+def calculate_onboard_storage(data_rate, downlink_time, mission_duration):
+    data_per_day = data_rate * downlink_time
+    return data_per_day * mission_duration  # MB
+
+
+# Callbacks
+
+# Power and data budgets are a handful of multiplications — compute them in
+# the browser so they don't round-trip through the server callback.
+app.clientside_callback(
+    """
+    function(area, eff, pc) {
+        const generated = 1361 * (area || 1.5) * ((eff || 28) / 100) * (1 - 0.35);
+        const used = pc || 50;
+        let out = 'Average Power Generated: ' + generated.toFixed(1) + ' W — Consumption: ' + used + ' W';
+        out += generated >= used ? ' ✅ Power budget is sufficient.' : ' ⚠️ Power budget is insufficient!';
+        return out;
+    }
+    """,
+    Output('power-budget-output', 'children'),
+    Input('solar-area', 'value'),
+    Input('solar-eff', 'value'),
+    Input('power-consumption', 'value')
+)
+
+app.clientside_callback(
+    """
+    function(data) {
+        if (!data) { return ''; }
+        return 'Estimated Global Revisit Time: ' + data.revisit_days + ' days';
+    }
+    """,
+    Output('revisit-time-output', 'children'),
+    Input('mission-outputs', 'data')
+)
+
+app.clientside_callback(
+    """
+    function(sensorType, resolution) {
+        const rates = {'MSI': 0.1, 'HSI': 0.5, 'SAR': 1.0};
+        const dataRate = (resolution || 0) * (rates[sensorType] || 0);
+        const required = dataRate * 12 * 365;  // 12 h/day downlink, 1-year mission
+        return 'Estimated Onboard Storage Required: ' + required.toFixed(1) + ' MB';
+    }
+    """,
+    Output('data-budget-output', 'children'),
+    Input('sensor-type', 'value'),
+    Input('sensor-resolution', 'value')
+)
+
+
+@app.callback(
+    [Output('orbit-plot', 'figure'),
+     Output('mission-outputs', 'data')],
+    Input('update-btn', 'n_clicks'),
+    State('orbit-type', 'value'),
+    State('altitude', 'value'),
+    State('inclination', 'value'),
+    prevent_initial_call=True
+)
+
+
+
+def update_orbit(n_clicks, orbit_type, altitude, inclination):
+    alt_km, inc_deg = _PRESETS.get(
+        orbit_type, (float(altitude or 500), float(inclination or 90))
     )
+
+    # Fetch the (possibly cached) figure; round the key so float noise from
+    # the number inputs doesn't defeat the cache
+    fig = go.Figure(_build_orbit_fig_dict(round(alt_km, 3), round(inc_deg, 3)))
+
     # Revisit Time Estimate
     earth_circumference_km = 40075
     swath = 100  # init swath
     revisit_estimate_days = round(earth_circumference_km / (swath * 14), 1)
-    revisit_output = f"Estimated Global Revisit Time: {revisit_estimate_days} days"
-
-    # Power Budget Analysis
-    solar_constant = 1361  # W/m²
-    eclipse_fraction = 0.35  # rough average
-    solar_efficiency = (solar_eff or 28) / 100
-    area = solar_area or 1.5
-    generated_power = solar_constant * area * solar_efficiency * (1 - eclipse_fraction)
-    power_used = power_consumption or 50
-    power_output = f"Average Power Generated: {generated_power:.1f} W — Consumption: {power_used} W"
-    if generated_power >= power_used:
-        power_output += " ✅ Power budget is sufficient."
-    else:
-        power_output += " ⚠️ Power budget is insufficient!"
-
-    # Data Budget Analysis
-    data_rate = estimate_data_rate(sensor_type, sensor_resolution)
-    downlink_time = 12  # example: 12 hours of visibility per day
-    mission_duration = 365  # 1-year mission
-    required_storage = calculate_onboard_storage(data_rate, downlink_time, mission_duration)
-    data_output = f"Estimated Onboard Storage Required: {required_storage:.1f} MB"
-
-    return fig, revisit_output, power_output, data_output
+
+    return fig, {'revisit_days': revisit_estimate_days}
+
+
+def _warmup():
+    # Prime the figure cache for the default LEO preset so the first click
+    # serves from cache; this also exercises the sampling kernel, whose JIT
+    # compile is already paid at import time in core_orbit.
+    _build_orbit_fig_dict(500.0, 51.6)
 
 
 if __name__ == '__main__':
+    _warmup()
     app.run(debug=True)